@@ -0,0 +1,42 @@
+import functools
+
+from jsque import ast, parser, pipeline
+from jsque.pipeline import Pipeline
+
+
+@functools.lru_cache(maxsize=1024)
+def compile(query: str) -> Pipeline:
+    """Compile a jsque query string into an evaluation pipeline, which can be called on any number
+    of inputs. Pipelines are cached on the query string, so evaluating the same query on many inputs
+    only parses and lowers it once.
+
+    Args:
+        query (str): Query string to compile.
+
+    Raises:
+        Exception: If the query string is not a valid jsque expression.
+
+    Returns:
+        Pipeline: Callable evaluation pipeline for the query.
+    """
+    return ast.to_pipeline(parser.parse_jsque_expression(query))
+
+
+def cache_info() -> dict[str, functools._CacheInfo]:
+    """Statistics of jsque's query caches, for observing their hit rates.
+
+    Returns:
+        dict[str, functools._CacheInfo]: Cache statistics of compiled pipelines ("compile") and of
+        parsed query expressions ("parse").
+    """
+    return {
+        "compile": compile.cache_info(),
+        "parse": parser.parse_jsque_expression.cache_info(),
+    }
+
+
+def clear_caches() -> None:
+    """Clear jsque's caches of compiled pipelines, parsed query expressions and generated code."""
+    compile.cache_clear()
+    parser.parse_jsque_expression.cache_clear()
+    pipeline._compile_components.cache_clear()
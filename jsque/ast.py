@@ -13,13 +13,17 @@ children:
 """
 
 from abc import abstractmethod
-from typing import Any, ClassVar, Self
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Self, final
+from weakref import WeakValueDictionary
 from jsque import pipeline as pipe
 
 
 class DictIsomorphism:
     """Trait for defining a dict-isomorphism for a class."""
 
+    __slots__ = ()
+
     @abstractmethod
     def dict(self) -> dict: ...
 
@@ -46,12 +50,15 @@ class QueryTerm(DictIsomorphism):
     - children: list[QueryTerm] (the children terms of the QueryTerm, if any)
     """
 
+    __slots__ = ("type", "value", "_children")
+
     _registry: ClassVar = {}
     type: str
     value: Any
-    children: list["QueryTerm"]
 
-    def __init__(self, type: str, value: Any = None, children: list["QueryTerm"] = []):
+    def __init__(
+        self, type: str, value: Any = None, children: list["QueryTerm"] | None = None
+    ):
         """Initialize a new QueryTerm with the specified data.
 
         Args:
@@ -62,7 +69,14 @@ class QueryTerm(DictIsomorphism):
         """
         self.type = type
         self.value = value
-        self.children = children
+        self._children = children
+
+    @property
+    def children(self) -> list["QueryTerm"]:
+        """Children terms of the QueryTerm, if any. Subclasses with fixed children derive them from
+        their own attributes, so the list is only materialized when it is asked for.
+        """
+        return self._children if self._children is not None else []
 
     @classmethod
     def register(cls, name: str):
@@ -76,7 +90,30 @@ class QueryTerm(DictIsomorphism):
 
     def dict(self) -> dict:
         """Writes the query term to a dict object. If the term has children, it will also write them
-        to the dict, recursively invoking their `dict()` functions.
+        to the dict, walking the term's subtree in post-order.
+
+        Returns:
+            dict: Dictionary representation of the query term.
+        """
+        # Each term with children is visited twice: once to schedule its children, and once more
+        # after all of its children's dicts have been pushed (in order) onto the results stack.
+        results: list[dict] = []
+        stack: list[tuple[QueryTerm, bool]] = [(self, False)]
+        while stack:
+            term, expanded = stack.pop()
+            if not expanded and (children := term.children):
+                stack.append((term, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+            results.append(term._dict_node(results))
+        return results[0]
+
+    def _dict_node(self, results: list[dict]) -> dict:
+        """Writes the query term to a dict object, taking its children's dicts (if any) from the top
+        of the results stack. Subclasses with a fixed shape override this to skip the checks.
+
+        Args:
+            results (list[dict]): Stack of dicts written so far, ending with this term's children.
 
         Returns:
             dict: Dictionary representation of the query term.
@@ -84,71 +121,194 @@ class QueryTerm(DictIsomorphism):
         d: dict[str, Any] = {"type": self.type}
         if self.value is not None:
             d["value"] = self.value
-        if self.children:
-            d["children"] = list(map(lambda _d: _d.dict(), self.children))
+        if n_children := len(self.children):
+            d["children"] = results[-n_children:]
+            del results[-n_children:]
         return d
 
     @classmethod
     def fromdict(cls, d: "dict") -> "Self":
         """Construct a QueryTerm from a dict representation of the term. Looks up in the registry
-        for a QueryTerm constructor from the dictionary's "type" key.
+        for a QueryTerm constructor from each dictionary's "type" key, building the terms bottom-up.
+        A dict appearing more than once in the representation (e.g. through YAML aliases) is only
+        constructed once, with the resulting term shared between its parents.
 
         Args:
             d (dict): Dictionary representation of the query term.
 
+        Raises:
+            ASTException: If a dict has an unrecognized type, or contains itself.
+
         Returns:
             Self: Constructed QueryTerm from the dict.
         """
-        if d.get("type") not in cls._registry:
-            raise ASTException(
-                "Unrecognized type in dict QueryTerm: %r" % d.get("type")
-            )
-        _root_cls = cls._registry[d["type"]]
-        if children := d.get("children"):
-            children = list(map(lambda _d: cls.fromdict(_d), children))
-            if value := d.get("value"):
-                return _root_cls(value, children)
-            return _root_cls(*children)
-        if value := d.get("value"):
-            return _root_cls(value)
-        return _root_cls()
+        # Terms already constructed, keyed by the id of the dict they were constructed from.
+        memo: dict[int, QueryTerm] = {}
+        pending: set[int] = set()
+        stack: list[tuple[dict, bool]] = [(d, False)]
+        registry = cls._registry
+        while stack:
+            _d, expanded = stack.pop()
+            key = id(_d)
+            if key in memo:
+                continue
+            children = _d.get("children")
+            if not expanded:
+                if key in pending:
+                    raise ASTException("Cyclic dict QueryTerm: %r" % _d.get("type"))
+                if _d.get("type") not in registry:
+                    raise ASTException(
+                        "Unrecognized type in dict QueryTerm: %r" % _d.get("type")
+                    )
+                if children:
+                    pending.add(key)
+                    stack.append((_d, True))
+                    stack.extend((child, False) for child in reversed(children))
+                    continue
+            _root_cls = registry[_d["type"]]
+            if children:
+                children = [memo[id(child)] for child in children]
+                if value := _d.get("value"):
+                    term = _root_cls(value, children)
+                else:
+                    term = _root_cls(*children)
+                pending.discard(key)
+            elif value := _d.get("value"):
+                term = _root_cls(value)
+            else:
+                term = _root_cls()
+            memo[key] = term
+        return memo[id(d)]
 
 
 class QueryOp(QueryTerm):
     """A QueryOp is a QueryTerm that represents an operation on a query expression. It has a `pipe()`
     interface for converting the operation to a pipeline component for evaluation.
+
+    Attributes:
+    - _pipe: Pipe (the operation's pipeline component, once it has been built by `pipe()`)
     """
 
+    __slots__ = ("_pipe",)
+
     @abstractmethod
-    def pipe(self) -> pipe.Pipe: ...
+    def _build_pipe(self) -> pipe.Pipe: ...
+
+    def _dict_node(self, results: list[dict]) -> dict:
+        n_children = len(self.children)
+        children = results[-n_children:]
+        del results[-n_children:]
+        return {"type": self.type, "children": children}
+
+    def pipe(self) -> pipe.Pipe:
+        """Pipeline component for the operation. Pipeline components are stateless, so the component
+        is built on first use and reused by every later pipeline containing this operation.
+
+        Returns:
+            pipe.Pipe: Pipeline component for the operation.
+        """
+        try:
+            return self._pipe
+        except AttributeError:
+            self._pipe = self._build_pipe()
+            return self._pipe
 
 
 @QueryTerm.register("root")
+@final
 class Root(QueryTerm):
+    """The root term is stateless, so a single instance is shared by every query expression."""
+
+    __slots__ = ()
+
+    _instance: ClassVar["Root | None"] = None
+
+    def __new__(cls) -> "Root":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
         super().__init__("root")
 
+    def _dict_node(self, results: list[dict]) -> dict:
+        return {"type": "root"}
+
 
 QueryExpr = Root | QueryOp
 
 
+# Range of index numbers whose Index terms are shared, and the cache of those shared terms.
+_SMALL_INDEX_MIN, _SMALL_INDEX_MAX = -128, 256
+_SMALL_INDICES: dict[int, "Index"] = {}
+
+
 @QueryTerm.register("index")
+@final
 class Index(QueryTerm):
+    """Index terms are shared between query expressions for small index numbers, which make up
+    nearly all indices seen in practice (similar to CPython's small-int cache).
+    """
+
+    __slots__ = ("number",)
+
     number: int
 
+    def __new__(cls, number: int) -> "Index":
+        if (
+            type(number) is not int
+            or not _SMALL_INDEX_MIN <= number <= _SMALL_INDEX_MAX
+        ):
+            return super().__new__(cls)
+        if (index := _SMALL_INDICES.get(number)) is None:
+            index = _SMALL_INDICES[number] = super().__new__(cls)
+        return index
+
     def __init__(self, number: int):
         super().__init__("index", number)
         self.number = number
 
+    def __getnewargs__(self) -> tuple[int]:
+        # Copies and unpickled terms are created through __new__, so they share small indices too.
+        return (self.number,)
+
+    def _dict_node(self, results: list[dict]) -> dict:
+        return {"type": "index", "value": self.number}
+
+
+# Identifier terms currently in use, keyed on their key, so that repeated identifiers share a term.
+_IDENTIFIERS: "WeakValueDictionary[str, Identifier]" = WeakValueDictionary()
+
 
 @QueryTerm.register("identifier")
+@final
 class Identifier(QueryTerm):
+    """Identifier terms are shared between query expressions for as long as any of them is in use,
+    so that repeated keys don't allocate a new term each time they're parsed.
+    """
+
+    __slots__ = ("key", "__weakref__")
+
     key: str
 
+    def __new__(cls, key: str) -> "Identifier":
+        if type(key) is not str:
+            return super().__new__(cls)
+        if (identifier := _IDENTIFIERS.get(key)) is None:
+            identifier = _IDENTIFIERS[key] = super().__new__(cls)
+        return identifier
+
     def __init__(self, key: str):
         super().__init__("identifier", key)
         self.key = key
 
+    def __getnewargs__(self) -> tuple[str]:
+        # Copies and unpickled terms are created through __new__, so they're shared too.
+        return (self.key,)
+
+    def _dict_node(self, results: list[dict]) -> dict:
+        return {"type": "identifier", "value": self.key}
+
 
 def primary_expr_class(d: "dict") -> "type[QueryExpr]":
     """Looks up into the registry for the correct class for the QueryExpr from the dictionary's "type",
@@ -160,79 +320,124 @@ def primary_expr_class(d: "dict") -> "type[QueryExpr]":
     Returns:
         type[QueryExpr]: Constructor (type) for the QueryExpr one can construct from the dict.
     """
-    try:
-        return {
-            "root": Root,
-            "idx_op": IndexExpr,
-            "mmap_op": MemberMapExpr,
-            "sub_op": SubExpr,
-            "cmap_op": ChildMapExpr,
-        }[d["type"]]
-    except KeyError:
+    expr_class = _PRIMARY_EXPR_CLASSES.get(d.get("type"))
+    if expr_class is None:
         raise ASTException(
             "Unrecognized type in dict representing QueryExpr: %r" % d.get("type")
         )
+    return expr_class
 
 
 @QueryTerm.register("idx_op")
+@final
 class IndexExpr(QueryOp):
+    __slots__ = ("sequence", "item")
+
     sequence: QueryExpr
     item: Index
 
     def __init__(self, sequence: QueryExpr, item: Index):
-        if not isinstance(item, Index):
+        if __debug__ and type(item) is not Index:
             raise IndexError("Bad index argument supplied: %r\n\nMust be Index." % item)
-        super().__init__("idx_op", children=[sequence, item])
+        super().__init__("idx_op")
         self.sequence = sequence
         self.item = item
 
-    def pipe(self) -> pipe.Injection:
+    @property
+    def children(self) -> list[QueryTerm]:
+        return [self.sequence, self.item]
+
+    def _build_pipe(self) -> pipe.Injection:
         return pipe.Index(self.item.number)
 
 
 @QueryTerm.register("mmap_op")
+@final
 class MemberMapExpr(QueryOp):
+    __slots__ = ("sequence",)
+
     sequence: QueryExpr
 
     def __init__(self, sequence: QueryExpr):
-        super().__init__("mmap_op", children=[sequence])
+        super().__init__("mmap_op")
         self.sequence = sequence
 
-    def pipe(self) -> pipe.Surjection:
+    @property
+    def children(self) -> list[QueryTerm]:
+        return [self.sequence]
+
+    def _build_pipe(self) -> pipe.Surjection:
         return pipe.MemberMap()
 
 
 @QueryTerm.register("sub_op")
+@final
 class SubExpr(QueryOp):
+    __slots__ = ("parent", "child")
+
     parent: QueryExpr
     child: Identifier
 
     def __init__(self, parent: QueryExpr, child: Identifier):
-        if not isinstance(child, Identifier):
+        if __debug__ and type(child) is not Identifier:
             raise AttributeError(
                 "Bad sub-argument supplied: %r\n\nMust be Identifier." % child
             )
-        super().__init__("sub_op", children=[parent, child])
+        super().__init__("sub_op")
 
         self.parent = parent
         self.child = child
 
-    def pipe(self) -> pipe.Injection:
+    @property
+    def children(self) -> list[QueryTerm]:
+        return [self.parent, self.child]
+
+    def _build_pipe(self) -> pipe.Injection:
         return pipe.Sub(self.child.key)
 
 
 @QueryTerm.register("cmap_op")
+@final
 class ChildMapExpr(QueryOp):
+    __slots__ = ("parent",)
+
     parent: QueryExpr
 
     def __init__(self, parent: QueryExpr):
-        super().__init__("cmap_op", children=[parent])
+        super().__init__("cmap_op")
         self.parent = parent
 
-    def pipe(self) -> pipe.Surjection:
+    @property
+    def children(self) -> list[QueryTerm]:
+        return [self.parent]
+
+    def _build_pipe(self) -> pipe.Surjection:
         return pipe.ChildMap()
 
 
+# Lookup from the "type" key of a dict to the QueryExpr class it represents.
+_PRIMARY_EXPR_CLASSES: dict[str, "type[QueryExpr]"] = {
+    "root": Root,
+    "idx_op": IndexExpr,
+    "mmap_op": MemberMapExpr,
+    "sub_op": SubExpr,
+    "cmap_op": ChildMapExpr,
+}
+
+
+# Getter for the left operand of each query operation, keyed on the exact operation type.
+_LEFT_OPERAND: dict[type, Callable[[QueryOp], QueryExpr]] = {
+    IndexExpr: attrgetter("sequence"),
+    MemberMapExpr: attrgetter("sequence"),
+    SubExpr: attrgetter("parent"),
+    ChildMapExpr: attrgetter("parent"),
+}
+
+
+# The root has no pipeline component to execute, so a root query evaluates with a null pipeline.
+_ROOT_PIPELINE = pipe.Pipeline()
+
+
 def to_pipeline(query: QueryExpr) -> pipe.Pipeline:
     """Parses a jsque query expression AST into a pipeline for evaluation.
 
@@ -245,19 +450,16 @@ def to_pipeline(query: QueryExpr) -> pipe.Pipeline:
     Returns:
         pipe.Pipeline: Pipeline for evaluating the query expression.
     """
-    # Root case has no pipeline component to execute (null pipeline).
-    if isinstance(query, Root):
-        return pipe.Pipeline()
-    # Other expressions have a .pipe() method to convert them to a pipeline component, which can
-    # be concatenated onto the pipeline. Because everything associates left, the concatenation
-    # of the second argument's pipe is always on the right.
-    elif isinstance(query, IndexExpr):
-        return to_pipeline(query.sequence) + pipe.Pipeline(query.pipe())
-    elif isinstance(query, MemberMapExpr):
-        return to_pipeline(query.sequence) + pipe.Pipeline(query.pipe())
-    elif isinstance(query, SubExpr):
-        return to_pipeline(query.parent) + pipe.Pipeline(query.pipe())
-    elif isinstance(query, ChildMapExpr):
-        return to_pipeline(query.parent) + pipe.Pipeline(query.pipe())
-    else:
-        raise ASTException("unexpected term: %r" % query)
+    # Walk down the left spine of the AST, collecting each operation's pipeline component. Because
+    # everything associates left, the components are collected right-to-left. The walk stops at the
+    # first term which is not a query operation, which must be the root (null pipeline component).
+    components: list[pipe.Pipe] = []
+    node = query
+    while (left_operand := _LEFT_OPERAND.get(type(node))) is not None:
+        components.append(node.pipe())
+        node = left_operand(node)
+    if type(node) is not Root:
+        raise ASTException("unexpected term: %r" % node)
+    if not components:
+        return _ROOT_PIPELINE
+    return pipe.Pipeline(*reversed(components))
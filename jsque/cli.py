@@ -1,7 +1,94 @@
 import argparse
+import json
+import re
+import sys
 from pathlib import Path
 from typing import Any
 
+import yaml
+
+from jsque import ast, format, parser
+
+# Prefer the libyaml-backed loader, falling back to pure Python when unavailable.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Escaped UTF-16 surrogates (e.g. "\ud83d"), which libyaml rejects but the pure Python loader reads.
+_ESCAPED_SURROGATE = re.compile(r"\\u[dD][89a-fA-F]")
+
+
+def safe_load(stream: str) -> Any:
+    """Load a YAML document with the fastest available safe loader. Documents with escaped
+    surrogates are loaded by the pure Python loader, which reads them the same way as before.
+    """
+    if "\\u" in stream and _ESCAPED_SURROGATE.search(stream) is not None:
+        return yaml.load(stream, Loader=yaml.SafeLoader)
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def safe_dump(data: Any, **kwargs) -> str:
+    """Dump an object to YAML with the pure Python safe dumper. libyaml's dumper is faster, but
+    doesn't always produce the same output (e.g. for empty string keys, or plain scalar documents).
+    """
+    return yaml.dump(data, Dumper=yaml.SafeDumper, **kwargs)
+
+
+def _reject_constant(constant: str) -> Any:
+    """Rejects the non-standard JSON constants NaN, Infinity and -Infinity, so that subjects
+    containing them are loaded as YAML (which reads them as strings) instead.
+    """
+    raise ValueError("Non-standard JSON constant: %s" % constant)
+
+
+# JSON number literals which YAML 1.1 also reads as floats: those with a decimal point, and with a
+# signed exponent (if any). Others, like 1e-07 or 1.5e20, are strings in YAML.
+_YAML_FLOAT = re.compile(r"-?[0-9]+\.[0-9]*(?:[eE][-+][0-9]+)?")
+
+
+# Anything in a JSON document which YAML reads differently: escaped surrogates (which JSON combines
+# into a single code point), and characters which YAML treats as line breaks (NEL, LS and PS) or
+# doesn't accept at all (non-printable characters and unescaped surrogates).
+_JSON_DIVERGENCE = re.compile(
+    r"\\u[dD][89a-fA-F]"
+    r"|[^\t\n\r\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+def _parse_float(literal: str) -> float:
+    """Parses a JSON float, rejecting those which YAML reads as strings, so that subjects
+    containing them are loaded as YAML instead.
+    """
+    if _YAML_FLOAT.fullmatch(literal) is None:
+        raise ValueError("JSON float is a string in YAML: %s" % literal)
+    return float(literal)
+
+
+def load_subject(stream: str) -> Any:
+    """Load an eval subject, which may be YAML or JSON, the same way as `safe_load` would.
+
+    JSON subjects are the common case, which the json module parses much faster than PyYAML. So
+    subjects are parsed as JSON first, falling back to YAML when they're not valid JSON, or contain
+    anything which JSON reads differently from YAML: non-standard constants (e.g. NaN), floats
+    without a decimal point or sign in their exponent, and the characters matched by
+    `_JSON_DIVERGENCE`.
+
+    Args:
+        stream (str): YAML or JSON document to load.
+
+    Returns:
+        Any: Loaded subject.
+    """
+    if _JSON_DIVERGENCE.search(stream) is not None:
+        return safe_load(stream)
+    try:
+        return json.loads(
+            stream, parse_constant=_reject_constant, parse_float=_parse_float
+        )
+    except ValueError:
+        return safe_load(stream)
+
 
 def input_subparsers(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     """Enriches a command's subparser with -f and -s arguments for options to pass input.
@@ -21,17 +108,12 @@ def input_subparsers(parser: argparse.ArgumentParser) -> argparse.ArgumentParser
     return parser
 
 
-class CLIException(Exception):
-    pass
-
-
-def main():
-    """Main entrypoint for jsque CLI.
+def build_argparser() -> argparse.ArgumentParser:
+    """Builds the full argument parser for the jsque CLI.
 
-    Raises:
-        CLIException: If the command is not recognized, or if the input is not provided.
+    Returns:
+        argparse.ArgumentParser: Argument parser for all jsque commands.
     """
-
     argparser = argparse.ArgumentParser(description="jsque CLI")
     cmd_subparser = argparser.add_subparsers(title="cmd", dest="cmd")
 
@@ -55,15 +137,66 @@ def main():
     eval_subparser.add_argument(
         "-q", type=str, help="jsque query expression", required=True, dest="query"
     )
+    return argparser
+
+
+# Flags accepted by each command, mapped to the destination and type of their value. These mirror
+# the arguments registered on the subparsers in `build_argparser`.
+INPUT_FLAGS = {
+    "-f": ("input", Path),
+    "--file": ("input", Path),
+    "-s": ("input", str),
+    "--stdin": ("input", str),
+}
+COMMAND_FLAGS = {
+    "parse": INPUT_FLAGS,
+    "format": INPUT_FLAGS,
+    "eval": {**INPUT_FLAGS, "-q": ("query", str)},
+}
+
+
+def fast_parse_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parses the common `<cmd> <flag> <value> ...` invocations without building the full argument
+    parser. Anything outside of that simple grammar (e.g. `--help`, `--file=...`, unknown flags or a
+    missing `-q`) is left to the full argument parser, so it reports errors and help as usual.
+
+    Args:
+        argv (list[str]): Command line arguments, excluding the program name.
+
+    Returns:
+        argparse.Namespace | None: Parsed arguments, or None if the full parser should be used.
+    """
+    if not argv or (flags := COMMAND_FLAGS.get(argv[0])) is None or len(argv) % 2 == 0:
+        return None
+    values: dict[str, Any] = dict.fromkeys(dest for dest, _ in flags.values())
+    for flag, value in zip(argv[1::2], argv[2::2]):
+        if flag not in flags or value.startswith("-"):
+            return None
+        dest, value_type = flags[flag]
+        values[dest] = value_type(value)
+    # eval requires a query expression, so leave reporting its absence to the full parser.
+    if argv[0] == "eval" and values["query"] is None:
+        return None
+    return argparse.Namespace(cmd=argv[0], **values)
+
 
-    # parse args
-    arguments = argparser.parse_args()
+class CLIException(Exception):
+    pass
+
+
+def main():
+    """Main entrypoint for jsque CLI.
+
+    Raises:
+        CLIException: If the command is not recognized, or if the input is not provided.
+    """
+
+    # parse args, only building the full argument parser when the fast path can't handle them
+    arguments = fast_parse_args(sys.argv[1:]) or build_argparser().parse_args()
 
     if not arguments.cmd:
         raise CLIException("cmd required")
 
-    from jsque import ast, parser
-
     parsed_ast: ast.QueryTerm
 
     if not arguments.input:
@@ -80,27 +213,19 @@ def main():
 
     if arguments.cmd == "eval":
         parsed_ast = parser.parse_jsque_expression(arguments.query)
-        import yaml
-
-        subject = yaml.safe_load(arguments.input)
+        subject = load_subject(arguments.input)
         result_obj = ast.to_pipeline(parsed_ast).eval(subject)
-        _result = yaml.safe_dump(result_obj, sort_keys=False)
+        _result = safe_dump(result_obj, sort_keys=False)
     elif arguments.cmd in ("parse", "format"):
         try:
             parsed_ast = parser.parse_jsque_expression(arguments.input)
         except Exception:
-            import yaml
-
-            yml_content = yaml.safe_load(arguments.input)
+            yml_content = safe_load(arguments.input)
             primary = ast.primary_expr_class(yml_content)
             parsed_ast = primary.fromdict(yml_content)
         if arguments.cmd == "parse":
-            import yaml
-
-            _result = yaml.safe_dump(parsed_ast.dict(), sort_keys=False)
+            _result = safe_dump(parsed_ast.dict(), sort_keys=False)
         else:
-            from jsque import format
-
             _result = format.format_jsque_expression(parsed_ast)
     else:
         raise CLIException("unexpected cmd: %r" % arguments.cmd)
@@ -1,3 +1,5 @@
+from typing import Any, Callable
+
 from jsque import ast
 
 
@@ -5,6 +7,21 @@ class FormatException(Exception):
     pass
 
 
+# Formatters for each type of query term, returning the term's formatted fragment along with its
+# left operand (or None, if the term ends the expression). Fragments are built with %-formatting,
+# which skips the per-operand __format__ dispatch of f-strings, and accepts non-str keys (e.g. from
+# `QueryTerm.fromdict`) as the f-strings did.
+_FORMATTERS: dict[type, Callable[[Any], tuple[str, ast.QueryTerm | None]]] = {
+    ast.Root: lambda term: ("@", None),
+    ast.Index: lambda term: (str(term.number), None),
+    ast.IndexExpr: lambda term: ("[%s]" % (term.item.number,), term.sequence),
+    ast.MemberMapExpr: lambda term: ("[*]", term.sequence),
+    ast.SubExpr: lambda term: (".%s" % (term.child.key,), term.parent),
+    ast.ChildMapExpr: lambda term: (".*", term.parent),
+    ast.Identifier: lambda term: ("%s" % (term.key,), None),
+}
+
+
 def format_jsque_expression(query: ast.QueryExpr) -> str:
     """Format a jsque query expression AST back into a string.
 
@@ -17,25 +34,14 @@ def format_jsque_expression(query: ast.QueryExpr) -> str:
     Returns:
         str: Formatted jsque query expression string
     """
-    if isinstance(query, ast.Root):
-        return "@"
-    elif isinstance(query, ast.Index):
-        return str(query.number)
-    elif isinstance(query, ast.IndexExpr):
-        format_sequence: str = format_jsque_expression(query.sequence)
-        format_item: str = str(query.item.number)
-        return f"{format_sequence}[{format_item}]"
-    elif isinstance(query, ast.MemberMapExpr):
-        format_sequence: str = format_jsque_expression(query.sequence)
-        return f"{format_sequence}[*]"
-    elif isinstance(query, ast.SubExpr):
-        format_parent: str = format_jsque_expression(query.parent)
-        format_child: str = query.child.key
-        return f"{format_parent}.{format_child}"
-    elif isinstance(query, ast.ChildMapExpr):
-        format_parent: str = format_jsque_expression(query.parent)
-        return f"{format_parent}.*"
-    elif isinstance(query, ast.Identifier):
-        return query.key
-    else:
-        raise FormatException("unexpected term: %r" % query)
+    # Walk down the left spine of the AST, collecting each term's formatted fragment. Because
+    # everything associates left, the fragments are collected right-to-left, and joined once at the
+    # end rather than re-copying the formatted prefix at every level.
+    parts: list[str] = []
+    term: ast.QueryTerm | None = query
+    while term is not None:
+        if (formatter := _FORMATTERS.get(type(term))) is None:
+            raise FormatException("unexpected term: %r" % term)
+        part, term = formatter(term)
+        parts.append(part)
+    return "".join(reversed(parts))
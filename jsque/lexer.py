@@ -1,22 +1,36 @@
-from enum import Enum
+from enum import IntEnum
 import re
 import string
+from typing import NamedTuple
 
 
-class TokenType(Enum):
-    """Different types of tokens in jsque."""
+class TokenType(IntEnum):
+    """Different types of tokens in jsque. Token types are ints, so comparing them is cheap."""
 
-    Identifier = "identifier"
-    Wildcard = "wild"
-    SubOp = "sub_op"
-    LeftBrac = "lbrac"
-    RightBrac = "rbrac"
-    Index = "index"
-    Root = "root"
+    Identifier = 1
+    Wildcard = 2
+    SubOp = 3
+    LeftBrac = 4
+    RightBrac = 5
+    Index = 6
+    Root = 7
 
 
-class Token:
-    """Object for storing a token string, with its associated type.
+# Short names of each token type, used in token representations.
+_TOKEN_TYPE_NAMES: dict[TokenType, str] = {
+    TokenType.Identifier: "identifier",
+    TokenType.Wildcard: "wild",
+    TokenType.SubOp: "sub_op",
+    TokenType.LeftBrac: "lbrac",
+    TokenType.RightBrac: "rbrac",
+    TokenType.Index: "index",
+    TokenType.Root: "root",
+}
+
+
+class Token(NamedTuple):
+    """Tuple of a token string's type and the string itself. Tokens are plain tuples, so the parser
+    can unpack them directly.
 
     Classmethods:
 
@@ -30,18 +44,15 @@ class Token:
     - index: Create an index token.
       args: v: str (the index string to store in the token)
 
+    Tokens with a fixed value (root, sub_op, wildcard and brackets) are shared instances.
     """
 
     type: TokenType
     value: str
 
-    def __init__(self, type: TokenType, value: str):
-        self.type = type
-        self.value = value
-
     @classmethod
     def root(cls):
-        return cls(TokenType.Root, "@")
+        return _ROOT_TOKEN
 
     @classmethod
     def identifier(cls, v: str):
@@ -49,19 +60,19 @@ class Token:
 
     @classmethod
     def sub_op(cls):
-        return cls(TokenType.SubOp, ".")
+        return _SUB_OP_TOKEN
 
     @classmethod
     def wildcard(cls):
-        return cls(TokenType.Wildcard, "*")
+        return _WILDCARD_TOKEN
 
     @classmethod
     def left_bracket(cls):
-        return cls(TokenType.LeftBrac, "[")
+        return _LEFT_BRACKET_TOKEN
 
     @classmethod
     def right_bracket(cls):
-        return cls(TokenType.RightBrac, "]")
+        return _RIGHT_BRACKET_TOKEN
 
     @classmethod
     def index(cls, v: str):
@@ -69,10 +80,58 @@ class Token:
 
     def __repr__(self) -> str:
         """Human-readable representation of the token."""
-        return f'{self.type.value.upper()}("{self.value}")'
-
-
-IDENTIFIER_TERMINATORS = [".", "["] + list(string.whitespace)
+        return f'{_TOKEN_TYPE_NAMES[self.type].upper()}("{self.value}")'
+
+
+# Tokens with a fixed value are never modified, so a single instance of each is shared by every
+# tokenized query.
+_ROOT_TOKEN = Token(TokenType.Root, "@")
+_SUB_OP_TOKEN = Token(TokenType.SubOp, ".")
+_WILDCARD_TOKEN = Token(TokenType.Wildcard, "*")
+_LEFT_BRACKET_TOKEN = Token(TokenType.LeftBrac, "[")
+_RIGHT_BRACKET_TOKEN = Token(TokenType.RightBrac, "]")
+
+IDENTIFIER_TERMINATORS = frozenset(".[" + string.whitespace)
+IDENTIFIER_INITIALS = frozenset(string.ascii_letters + "_")
+INDEX_CHARS = frozenset(string.digits + "-")
+
+
+def _char_class(chars: frozenset[str], negate: bool = False) -> str:
+    """Regex character class matching any (or with `negate`, none) of the given characters."""
+    return "[%s%s]" % ("^" if negate else "", re.escape("".join(sorted(chars))))
+
+
+# Identifiers run until a terminator, and indices are runs of digits and minus signs.
+_IDENTIFIER_CHAR = _char_class(IDENTIFIER_TERMINATORS, negate=True)
+_INDEX_CHAR = _char_class(INDEX_CHARS)
+IDENTIFIER_PATTERN = re.compile(_IDENTIFIER_CHAR + "*")
+INDEX_PATTERN = re.compile(_INDEX_CHAR + "*")
+
+# Pattern matching a single token (or run of whitespace) at a time, with each alternative named
+# after the TokenType it produces.
+TOKEN_PATTERN = re.compile(
+    "|".join(
+        [
+            "(?P<Whitespace>%s+)" % _char_class(frozenset(string.whitespace)),
+            "(?P<Root>@)",
+            "(?P<Identifier>%s%s*)"
+            % (_char_class(IDENTIFIER_INITIALS), _IDENTIFIER_CHAR),
+            r"(?P<SubOp>\.)",
+            r"(?P<LeftBrac>\[)",
+            r"(?P<RightBrac>\])",
+            r"(?P<Wildcard>\*)",
+            "(?P<Index>%s+)" % _INDEX_CHAR,
+        ]
+    )
+)
+_TOKEN_TYPES: dict[str, TokenType] = dict(TokenType.__members__)
+_FIXED_TOKENS: dict[str, Token] = {
+    "Root": _ROOT_TOKEN,
+    "SubOp": _SUB_OP_TOKEN,
+    "Wildcard": _WILDCARD_TOKEN,
+    "LeftBrac": _LEFT_BRACKET_TOKEN,
+    "RightBrac": _RIGHT_BRACKET_TOKEN,
+}
 
 
 def next_identifier(source: str, start_idx: int) -> str:
@@ -85,14 +144,7 @@ def next_identifier(source: str, start_idx: int) -> str:
     Returns:
         str: Consumed identifier name
     """
-    ident: str = ""
-    idx = start_idx
-    while idx < len(source):
-        if (c := source[idx]) in IDENTIFIER_TERMINATORS:
-            return ident
-        idx += 1
-        ident += c
-    return ident
+    return IDENTIFIER_PATTERN.match(source, start_idx).group()
 
 
 def next_index(source: str, start_idx: int) -> str:
@@ -105,12 +157,7 @@ def next_index(source: str, start_idx: int) -> str:
     Returns:
         str: Consumed index string
     """
-    num: str = ""
-    idx = start_idx
-    while idx < len(source) and source[idx] in string.digits + "-":
-        num += source[idx]
-        idx += 1
-    return num
+    return INDEX_PATTERN.match(source, start_idx).group()
 
 
 class LexerException(Exception):
@@ -130,45 +177,21 @@ def tokenize(source: str) -> list[Token]:
         list[Token]: List of jsque tokens parsed from the source string.
     """
 
-    tokens = []
+    tokens: list[Token] = []
     idx = 0
 
+    # Each match of the token pattern consumes one token (or a run of whitespace), named by the
+    # group which matched it.
     while idx < len(source):
-        char_i: str = source[idx]
-
-        if char_i in string.whitespace:
-            idx += 1
-            continue
-
-        if char_i == "@":
-            tokens += [Token.root()]
-            idx += 1
-        elif char_i in (string.ascii_letters + "_"):
-            id_name = next_identifier(source, idx)
-            idx += len(id_name)
-            tokens += [Token.identifier(id_name)]
-        elif char_i == "@":
-            tokens += [Token.root()]
-            idx += 1
-        elif char_i == ".":
-            tokens += [Token.sub_op()]
-            idx += 1
-        elif char_i == "[":
-            tokens += [Token.left_bracket()]
-            idx += 1
-        elif char_i == "]":
-            tokens += [Token.right_bracket()]
-            idx += 1
-        elif char_i == "*":
-            tokens += [Token.wildcard()]
-            idx += 1
-        elif char_i in string.digits + "-":
-            index = next_index(source, idx)
-            idx += len(index)
-            tokens += [Token.index(index)]
-        else:
+        if (match := TOKEN_PATTERN.match(source, idx)) is None:
             raise LexerException(
-                "Unexpected character encountered during tokenize: %s" % char_i
+                "Unexpected character encountered during tokenize: %s" % source[idx]
             )
+        idx = match.end()
+        if (kind := match.lastgroup) == "Whitespace":
+            continue
+        if (token := _FIXED_TOKENS.get(kind)) is None:
+            token = Token(_TOKEN_TYPES[kind], match.group())
+        tokens.append(token)
 
     return tokens
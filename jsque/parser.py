@@ -1,3 +1,6 @@
+import functools
+from typing import Callable, Iterator
+
 from jsque.ast import (
     ChildMapExpr,
     Index,
@@ -8,58 +11,105 @@ from jsque.ast import (
     Identifier,
     IndexExpr,
 )
-from jsque.lexer import tokenize, TokenType
+from jsque.lexer import tokenize, Token, TokenType
+
+# Query operations built from the argument token of an index expression ("[0]") or a sub
+# expression (".key"), keyed on the argument's token type.
+_INDEX_ARGUMENTS: dict[TokenType, Callable[[QueryExpr, str], QueryExpr]] = {
+    TokenType.Index: lambda expr, value: IndexExpr(expr, Index(int(value))),
+    TokenType.Wildcard: lambda expr, value: MemberMapExpr(expr),
+}
+_SUB_ARGUMENTS: dict[TokenType, Callable[[QueryExpr, str], QueryExpr]] = {
+    TokenType.Identifier: lambda expr, value: SubExpr(expr, Identifier(value)),
+    TokenType.Wildcard: lambda expr, value: ChildMapExpr(expr),
+}
+
+
+def _parse_index_op(expr: QueryExpr, tokens: Iterator[Token]) -> QueryExpr:
+    """Parse the remainder of an index expression's 3-gram, following its left bracket.
+
+    Args:
+        expr (QueryExpr): Left operand of the index expression.
+        tokens (Iterator[Token]): Remaining tokens, starting after the left bracket.
+
+    Raises:
+        Exception: If the index expression is incomplete or has a bad argument.
+
+    Returns:
+        QueryExpr: IndexExpr or MemberMapExpr applied to the left operand.
+    """
+    inner, rbrac = next(tokens, None), next(tokens, None)
+    if rbrac is None:
+        raise Exception("Not enough tokens to complete index expression.")
+    inner_type, inner_value = inner
+    # Argument can be index or wildcard, mapping to IndexExpr and MemberMapExpr, respectively.
+    if (argument := _INDEX_ARGUMENTS.get(inner_type)) is None:
+        raise Exception("Bad index argument. Got: %r" % inner_type)
+    # Must have closing bracket.
+    assert rbrac[0] == TokenType.RightBrac, "Expected right bracket, got %s" % (rbrac,)
+    return argument(expr, inner_value)
+
+
+def _parse_sub_op(expr: QueryExpr, tokens: Iterator[Token]) -> QueryExpr:
+    """Parse the remainder of a sub expression's 2-gram, following its dot.
 
+    Args:
+        expr (QueryExpr): Left operand of the sub expression.
+        tokens (Iterator[Token]): Remaining tokens, starting after the dot.
 
+    Raises:
+        Exception: If the sub expression is incomplete or has a bad argument.
+
+    Returns:
+        QueryExpr: SubExpr or ChildMapExpr applied to the left operand.
+    """
+    if (inner := next(tokens, None)) is None:
+        raise Exception("Not enough tokens to complete sub expression.")
+    inner_type, inner_value = inner
+    # Argument can be identifier or wildcard, mapping to SubExpr and ChildMapExpr, respectively.
+    if (argument := _SUB_ARGUMENTS.get(inner_type)) is None:
+        raise Exception("Bad sub expression argument. Got: %r" % inner_type)
+    return argument(expr, inner_value)
+
+
+# Query operations are the token 3-grams/2-grams which follow the left operand expression, parsed
+# by the handler for their leading token: a left bracket starts an index expression, and a dot
+# starts a sub expression.
+_OP_HANDLERS: dict[TokenType, Callable[[QueryExpr, Iterator[Token]], QueryExpr]] = {
+    TokenType.LeftBrac: _parse_index_op,
+    TokenType.SubOp: _parse_sub_op,
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_jsque_expression(source: str) -> QueryExpr:
+    """Parse a jsque query string into a query expression AST. Results are cached on the source
+    string, so repeated queries share a single AST, which must therefore not be modified.
+
+    Args:
+        source (str): Query string to parse.
 
-    tokens = tokenize(source)
-    if not tokens:
+    Raises:
+        Exception: If the query string is not a valid jsque expression.
+
+    Returns:
+        QueryExpr: Query expression AST parsed from the source string.
+    """
+    # Tokens are consumed front-to-back through an iterator, rather than popping from the front of
+    # the token list (which would shift the remaining tokens on every pop).
+    tokens = iter(tokenize(source))
+    if (root := next(tokens, None)) is None:
         raise Exception("No tokens to parse.")
 
     # All query expressions start with a root "@" token.
-    if tokens[0].type != TokenType.Root:
+    if root[0] != TokenType.Root:
         raise Exception("All expressions must start with a root '@'")
 
     expr: QueryExpr = Root()
-    tokens.pop(0)
-
-    while tokens:
-        # Query operations are the token 3-grams/2-grams which follow the left operand expression.
-        match (op_token := tokens.pop(0)).type:
-            # If we see a left bracket, we're parsing an index expression, and need a full 3-gram.
-            case TokenType.LeftBrac:
-                if not len(tokens) >= 2:
-                    raise Exception("Not enough tokens to complete index expression.")
-                inner = tokens.pop(0)
-                # Argument can be index or wildcard, mapping to IndexExpr and MemberMapExpr,
-                # respectively.
-                match inner.type:
-                    case TokenType.Index:
-                        expr = IndexExpr(expr, Index(int(inner.value)))
-                    case TokenType.Wildcard:
-                        expr = MemberMapExpr(expr)
-                    case other:
-                        raise Exception("Bad index argument. Got: %r" % other)
-                # Must have closing bracket.
-                assert (rbrac := tokens.pop(0)).type == TokenType.RightBrac, (
-                    "Expected right bracket, got %s" % rbrac
-                )
-            # If we see a dot, we're parsing a sub expression, and need a full 2-gram.
-            case TokenType.SubOp:
-                if not len(tokens) >= 1:
-                    raise Exception("Not enough tokens to complete sub expression.")
-                inner = tokens.pop(0)
-                # Argument can be identifier or wildcard, mapping to SubExpr and ChildMapExpr,
-                # respectively.
-                match inner.type:
-                    case TokenType.Identifier:
-                        expr = SubExpr(expr, Identifier(inner.value))
-                    case TokenType.Wildcard:
-                        expr = ChildMapExpr(expr)
-                    case other:
-                        raise Exception("Bad sub expression argument. Got: %r" % other)
-            case _:
-                raise Exception("Unexpected token: %r" % op_token)
+
+    for op_token in tokens:
+        if (handler := _OP_HANDLERS.get(op_token[0])) is None:
+            raise Exception("Unexpected token: %r" % (op_token,))
+        expr = handler(expr, tokens)
 
     return expr
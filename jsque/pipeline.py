@@ -1,13 +1,71 @@
 import abc
-from typing import Any, Generator
+import functools
+from typing import Any, Callable, Generator, Iterable
 
 
 class EvaluationException(Exception):
-    pass
+    """Exception raised when a query fails to evaluate on an object.
+
+    Exceptions created with `lazy` only format their message once it's first needed (e.g. when the
+    exception is displayed). Inputs can be large, so this avoids formatting them for exceptions
+    which are caught and discarded.
+    """
+
+    _template: str | None = None
+    _operands: tuple[Any, ...] = ()
+
+    @classmethod
+    def lazy(cls, template: str, *operands: Any) -> "EvaluationException":
+        """Creates an exception whose message is `template % operands`, formatted on first use.
+
+        Args:
+            template (str): %-format string of the exception's message.
+            *operands (Any): Operands of the message's format string.
+
+        Returns:
+            EvaluationException: Exception with the lazily formatted message.
+        """
+        exception = cls()
+        exception._template, exception._operands = template, operands
+        return exception
+
+    def _format(self) -> None:
+        """Formats a lazy exception's message, making it the exception's only argument."""
+        if self._template is not None:
+            BaseException.args.__set__(self, (self._template % self._operands,))
+            self._template, self._operands = None, ()
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        self._format()
+        return BaseException.args.__get__(self)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        self._template, self._operands = None, ()
+        BaseException.args.__set__(self, value)
+
+    def __str__(self) -> str:
+        self._format()
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._format()
+        return super().__repr__()
+
+    def __reduce__(self) -> Any:
+        self._format()
+        return super().__reduce__()
 
 
 class Pipe:
-    """Notion of a pipeline component which can be additively concatenated with other components."""
+    """Notion of a pipeline component which can be additively concatenated with other components.
+
+    Components (and pipelines) declare their attributes in `__slots__`, keeping them compact and
+    their attribute lookups cheap.
+    """
+
+    __slots__ = ()
 
     def __add__(self, other: "Pipe") -> "Pipeline":
         """Defining pipeline concatenation as the addition operator.
@@ -30,10 +88,16 @@ class Injection(Pipe):
     When an injection fails, it returns null or raises an exception.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def eval(self, x: Any) -> Any: ...
 
 
+# Sequence types which Index bounds-checks before indexing into.
+_SEQUENCE_TYPES = frozenset((list, tuple, str))
+
+
 class Index(Injection):
     """An Index pipe, which takes the "i"th element of its first argument.
 
@@ -41,6 +105,8 @@ class Index(Injection):
         number (int): Index to select from the first argument.
     """
 
+    __slots__ = ("number",)
+
     number: int
 
     def __init__(self, number: int) -> None:
@@ -59,14 +125,20 @@ class Index(Injection):
         Returns:
             Any: Member object at the index, or None if the index is out of bounds.
         """
-        if not hasattr(x, "__getitem__"):
-            raise EvaluationException(
-                "IndexExpr sequence must support __getitem__.\nCannot index into %s: %r"
-                % (type(x).__name__, x)
-            )
+        # Builtin sequences are bounds-checked up front (for int indices), so misses don't raise.
+        number = self.number
+        if type(number) is int and type(x) in _SEQUENCE_TYPES:
+            return x[number] if -len(x) <= number < len(x) else None
         try:
-            return x[self.number]
+            return x[number]
         except Exception:
+            # Only probe for __getitem__ once indexing has failed, keeping the common path cheap.
+            if not hasattr(x, "__getitem__"):
+                raise EvaluationException.lazy(
+                    "IndexExpr sequence must support __getitem__.\nCannot index into %s: %r",
+                    type(x).__name__,
+                    x,
+                ) from None
             return None
 
 
@@ -77,6 +149,8 @@ class Sub(Injection):
         key (str): Key to look up in the first argument.
     """
 
+    __slots__ = ("key",)
+
     key: str
 
     def __init__(self, key: str) -> None:
@@ -95,14 +169,19 @@ class Sub(Injection):
         Returns:
             Any: Member object at the key, or None if the key is not found.
         """
-        if not hasattr(x, "__getitem__"):
-            raise EvaluationException(
-                "SubExpr parent must support __getitem__.\nCannot lookup into %s: %r"
-                % (type(x).__name__, x)
-            )
         try:
+            # Dicts (the usual mapping) are looked up with get, so that misses don't raise.
+            if type(x) is dict:
+                return x.get(self.key)
             return x[self.key]
         except Exception:
+            # Only probe for __getitem__ once the lookup has failed, keeping the common path cheap.
+            if not hasattr(x, "__getitem__"):
+                raise EvaluationException.lazy(
+                    "SubExpr parent must support __getitem__.\nCannot lookup into %s: %r",
+                    type(x).__name__,
+                    x,
+                ) from None
             return None
 
 
@@ -118,6 +197,8 @@ class Surjection(Pipe):
     **Note**: I sometimes refer to a surjection as _exploding_ an input sequence.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def eval(self, x: Any) -> Generator[Any, None, None]: ...
 
@@ -125,6 +206,8 @@ class Surjection(Pipe):
 class MemberMap(Surjection):
     """A MemberMap pipe, which explodes the elements of its first argument."""
 
+    __slots__ = ()
+
     def eval(self, x: Any) -> Generator[Any, None, None]:
         """Explodes the sequence "x" into its elements (if it has any). If "x" does not support
         iteration, raises an exception.
@@ -138,15 +221,20 @@ class MemberMap(Surjection):
         Yields:
             Generator[Any, None, None]: Sequence of elements in the input sequence.
         """
-        if not hasattr(x, "__iter__"):
-            raise EvaluationException("MemberMapExpr sequence must support __iter__.")
-        for item in x:
-            yield item
+        try:
+            items = iter(x)
+        except TypeError:
+            raise EvaluationException(
+                "MemberMapExpr sequence must support __iter__."
+            ) from None
+        yield from items
 
 
 class ChildMap(Surjection):
     """A ChildMap pipe, which explodes the children/values of its first argument."""
 
+    __slots__ = ()
+
     def eval(self, x: Any) -> Generator[Any, None, None]:
         """Explodes the the object "x" into its values (if it has any). If "x" is not a mapping of
         keys to values, raises an exception.
@@ -160,26 +248,214 @@ class ChildMap(Surjection):
         Yields:
             Generator[Any, None, None]: Sequence of values in the input object.
         """
-        if not hasattr(x, "values"):
-            raise EvaluationException("ChildMapExpr parent must support values.")
-        for value in x.values():
-            yield value
+        try:
+            values = x.values
+        except AttributeError:
+            raise EvaluationException(
+                "ChildMapExpr parent must support values."
+            ) from None
+        yield from values()
+
+
+# Longest run of components fused into a single compiled function, and the most surjections (i.e.
+# nested comprehensions) within it. Deeper subscript chains exceed the compiler's recursion limit,
+# and deeper comprehensions its limit on nested brackets.
+_MAX_FUSED_COMPONENTS = 256
+_MAX_FUSED_SURJECTIONS = 64
+
+# Containers which a compiled MemberMap iterates over. Anything else (e.g. a one-shot iterator,
+# which could not be iterated again after falling back) fails the compiled function.
+_MEMBER_TYPES = frozenset((list, tuple, dict, str))
+
+
+def _members(x: Any) -> Any:
+    """Returns the container "x" for a compiled MemberMap, failing on other objects."""
+    if type(x) in _MEMBER_TYPES:
+        return x
+    raise TypeError(type(x).__name__)
+
+
+def _children(x: Any) -> Any:
+    """Returns the values of the dict "x" for a compiled ChildMap, failing on other objects."""
+    if type(x) is dict:
+        return x.values()
+    raise TypeError(type(x).__name__)
+
+
+def _sub(x: Any, key: str) -> Any:
+    """Looks up "key" in "x" for a compiled Sub within a surjection, mapping misses on dicts to None
+    (as Sub does) rather than failing the whole compiled function.
+    """
+    if type(x) is dict:
+        return x.get(key)
+    return x[key]
+
+
+def _index(x: Any, number: int) -> Any:
+    """Indexes into "x" for a compiled Index within a surjection, mapping out of bounds indices into
+    builtin sequences to None (as Index does) rather than failing the whole compiled function.
+    """
+    if type(x) in _SEQUENCE_TYPES:
+        return x[number] if -len(x) <= number < len(x) else None
+    return x[number]
+
+
+def _render_components(
+    spec: tuple[tuple[type, Any], ...], expr: str, depth: int = 0
+) -> str:
+    """Renders the Python expression which applies a sequence of fused components to "expr".
+
+    Injections subscript the expression in turn, and the first surjection becomes a list
+    comprehension, inside which the remaining components are rendered on each of its results.
+    Within a comprehension, injections call `_sub` and `_index` instead, so that a miss on one of
+    its results is None rather than failing (and re-evaluating) every result.
+
+    Args:
+        spec (tuple[tuple[type, Any], ...]): Fused components as (pipe type, index number or sub
+        key) pairs, with None in place of the key for surjections.
+        expr (str): Python expression to apply the components to.
+        depth (int, optional): Nesting depth of comprehensions around "expr". Defaults to 0.
+
+    Returns:
+        str: Python expression applying the components to "expr".
+    """
+    for i, (kind, key) in enumerate(spec):
+        if kind is Index or kind is Sub:
+            if depth and kind is Sub and expr.isidentifier():
+                # Lookups on a comprehension's variable check for a dict inline, skipping the call.
+                template = "(%(x)s.get(%(key)r) if type(%(x)s) is dict else _sub(%(x)s, %(key)r))"
+                expr = template % {"x": expr, "key": key}
+            elif depth:
+                expr = "%s(%s, %r)" % ("_index" if kind is Index else "_sub", expr, key)
+            else:
+                expr = "%s[%r]" % (expr, key)
+            continue
+        var = "x%d" % (depth + 1)
+        iterable = "%s(%s)" % ("_members" if kind is MemberMap else "_children", expr)
+        inner = _render_components(spec[i + 1 :], var, depth + 1)
+        return "[%s for %s in %s]" % (inner, var, iterable)
+    return expr
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_components(spec: tuple[tuple[type, Any], ...]) -> Callable[[Any], Any]:
+    """Compiles a function which applies a sequence of fused components to its argument, e.g.
+    `[x1["b"] for x1 in _members(x0["a"])]` for the query `@.a[*].b`, so that evaluating them costs
+    a single call rather than a call per component (and per result of each surjection).
+
+    The compiled function only handles the happy path, raising on any unexpected object (or miss
+    outside of a surjection), after which the components should be evaluated one by one.
+
+    Args:
+        spec (tuple[tuple[type, Any], ...]): Fused components as (pipe type, index number or sub
+        key) pairs, with None in place of the key for surjections.
+
+    Returns:
+        Callable[[Any], Any]: Function applying the components to its argument.
+    """
+    source = "def fused(x0):\n    return %s\n" % _render_components(spec, "x0")
+    namespace: dict[str, Any] = {
+        "_members": _members,
+        "_children": _children,
+        "_sub": _sub,
+        "_index": _index,
+    }
+    exec(source, namespace)
+    return namespace["fused"]
+
+
+def _component_exception(
+    component: Pipe, x: Any, e: EvaluationException
+) -> EvaluationException:
+    """Wraps an exception raised while evaluating a pipeline component, naming the component and the
+    type of object it was evaluated on.
+    """
+    component_name = type(component).__name__
+    return EvaluationException.lazy(
+        "Error evaluating %s on %s:\n%s", component_name, type(x).__name__, e
+    )
 
 
 class Pipeline:
     """A complete query plan formed by concatenating multiple pipeline components into a single
     evaluation pipeline.
 
+    Pipelines made up of Index/Sub/MemberMap/ChildMap pipes are fused into a single compiled
+    function, and otherwise their leading run of Index/Sub injections is. When the compiled function
+    fails (e.g. on a missing key), or doesn't cover the whole pipeline, the pipeline is evaluated in
+    up to three parts: the injections up to its first surjection, then the first surjection, and
+    then the _tail_ pipeline of the remaining components, which is evaluated on each result of the
+    surjection.
+
     Attributes:
         components (tuple[Pipe, ...]): Sequence of pipeline components to evaluate in order, from
         left to right.
     """
 
+    __slots__ = (
+        "components",
+        "_evals",
+        "_head",
+        "_head_length",
+        "_fused",
+        "_split",
+        "_tail",
+    )
+
     components: tuple[Pipe, ...]
+    _evals: tuple[Callable[[Any], Any], ...]
+    _head: Callable[[Any], Any] | None
+    _head_length: int
+    _fused: bool
+    _split: int
+    _tail: "Pipeline | None"
 
     def __init__(self, *components: Pipe):
         """Instantiate a new pipeline from the supplied components."""
         self.components = components
+        # Each component's eval method, bound once rather than on every evaluation.
+        self._evals = tuple(component.eval for component in components)
+        # Index of the first surjection (if any), and the tail pipeline following it, which is only
+        # built once it is first needed.
+        self._split = next(
+            (i for i, c in enumerate(components) if isinstance(c, Surjection)),
+            len(components),
+        )
+        self._tail = None
+        # The whole pipeline is fused into a single compiled function if possible, and otherwise
+        # its leading run of Index/Sub injections is.
+        spec: list[tuple[type, Any]] = []
+        surjections = 0
+        for component in components[:_MAX_FUSED_COMPONENTS]:
+            kind = type(component)
+            if kind is Index or kind is Sub:
+                key = component.number if kind is Index else component.key
+                if type(key) is not int and (kind is Index or type(key) is not str):
+                    break
+                spec.append((kind, key))
+            elif kind is MemberMap or kind is ChildMap:
+                if (surjections := surjections + 1) > _MAX_FUSED_SURJECTIONS:
+                    break
+                spec.append((kind, None))
+            else:
+                break
+        if len(spec) < len(components):
+            spec = spec[: self._split]
+        # A lone injection (e.g. the tail of `@[*][1]`) is its own head rather than being compiled,
+        # as it handles misses on dicts and sequences without raising an exception.
+        if len(spec) == 1 and spec[0][0] in (Index, Sub):
+            self._head = self._evals[0]
+        else:
+            self._head = _compile_components(tuple(spec)) if spec else None
+        self._head_length = len(spec)
+        # Fully fused pipelines (the most common queries) are entirely evaluated by the head.
+        self._fused = self._head is not None and self._head_length == len(components)
+
+    def __reduce__(self) -> tuple[type, tuple[Pipe, ...]]:
+        """Pickles (and copies) a pipeline as its components alone, since its compiled head can't
+        be pickled. The head is rebuilt (from the cache of compiled functions) on unpickling.
+        """
+        return (Pipeline, self.components)
 
     def __add__(self, other: "Pipeline") -> "Pipeline":
         """Concatenate two pipelines together, forming a new pipeline.
@@ -204,18 +480,61 @@ class Pipeline:
         Raises:
             EvaluationException: If any constituent pipeline component raises an exception.
         """
-        components = list(self.components)
-        while components and (component := components.pop(0)):
+        evals = self._evals
+        start = 0
+        if self._head is not None:
+            # The fused head only handles the happy path, where every component succeeds.
+            # Otherwise, the pipeline is evaluated component by component, which maps misses to
+            # None and reports objects which can't be subscripted or exploded.
             try:
-                if isinstance(component, Injection):
-                    x = component.eval(x)
-                elif isinstance(component, Surjection):
-                    right_pipeline = Pipeline(*components)
-                    return [right_pipeline.eval(y) for y in component.eval(x)]
+                x = self._head(x)
+            except Exception:
+                pass
+            else:
+                if self._fused:
+                    return x
+                start = self._head_length
+        split = self._split
+        for i in range(start, split):
+            try:
+                x = evals[i](x)
             except EvaluationException as e:
-                component_name = type(component).__name__
-                raise EvaluationException(
-                    "Error evaluating %s on %s:\n%s"
-                    % (component_name, type(x).__name__, e)
-                )
-        return x
+                raise _component_exception(self.components[i], x, e)
+        if split == len(evals):
+            return x
+        if (tail := self._tail) is None:
+            tail = self._tail = Pipeline(*self.components[split + 1 :])
+        tail_eval = tail.eval
+        try:
+            return [tail_eval(y) for y in evals[split](x)]
+        except EvaluationException as e:
+            raise _component_exception(self.components[split], x, e)
+
+    def eval_many(self, inputs: Iterable[Any]) -> list[Any]:
+        """Evaluates the query plan on each of a batch of input objects.
+
+        Args:
+            inputs (Iterable[Any]): Input objects to evaluate the query plan on.
+
+        Returns:
+            list[Any]: Result of the query plan on each input object, in order.
+
+        Raises:
+            EvaluationException: If any constituent pipeline component raises an exception.
+        """
+        evaluate = self.eval
+        if not self._fused:
+            return [evaluate(x) for x in inputs]
+        # Fully fused pipelines call their compiled head directly, only falling back to a full
+        # evaluation for inputs on which it fails.
+        head = self._head
+        results = []
+        for x in inputs:
+            try:
+                results.append(head(x))
+            except Exception:
+                results.append(evaluate(x))
+        return results
+
+    # Pipelines can be called directly as functions of their input, e.g. `jsque.compile(query)(x)`.
+    __call__ = eval
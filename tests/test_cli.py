@@ -0,0 +1,112 @@
+from pathlib import Path
+import pytest
+from jsque import cli
+
+
+@pytest.fixture
+def run_cli(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    def run(*argv: str) -> str:
+        monkeypatch.setattr("sys.argv", ["jsq", *argv])
+        cli.main()
+        return capsys.readouterr().out
+
+    return run
+
+
+@pytest.mark.parametrize(
+    "input,query,output",
+    [
+        pytest.param('{"a": 1}', "@.a", "1\n...\n\n"),
+        pytest.param('{"a": "Alice"}', "@.a", "Alice\n...\n\n"),
+        pytest.param('{"a": null}', "@.a", "null\n...\n\n"),
+        pytest.param('{"a": ""}', "@.a", "''\n\n"),
+        pytest.param('{"a": [1, {"b": 2}]}', "@.a", "- 1\n- b: 2\n\n"),
+        pytest.param('{"a": {"b": 2}}', "@.*", "- b: 2\n\n"),
+    ],
+)
+def test_cli__eval_output(run_cli, input: str, query: str, output: str):
+    assert run_cli("eval", "-q", query, "-s", input) == output
+
+
+@pytest.mark.parametrize(
+    "input,query,output",
+    [
+        pytest.param("a: [1, 2]", "@.a[-1]", "2\n...\n\n"),
+        pytest.param("- x\n- y: z\n", "@[1].y", "z\n...\n\n"),
+        pytest.param("NaN", "@", "NaN\n...\n\n"),
+        pytest.param('{"a": -Infinity}', "@.a", "-Infinity\n...\n\n"),
+        pytest.param("{a: 1}", "@.a", "1\n...\n\n"),
+        pytest.param('{"t": 1e-07}', "@.t", "1e-07\n...\n\n"),
+        pytest.param('{"t": 1e+20}', "@.t[*]", "- '1'\n- e\n- +\n- '2'\n- '0'\n\n"),
+        pytest.param('{"t": 1.5e+3}', "@.t", "1500.0\n...\n\n"),
+        pytest.param('["\\ud83d\\ude00"]', "@[0]", '"\\uD83D\\uDE00"\n\n'),
+        pytest.param('["a\u2028b"]', "@[0]", '"a\\Lb"\n\n'),
+    ],
+)
+def test_cli__eval_yaml_fallback(run_cli, input: str, query: str, output: str):
+    assert run_cli("eval", "-q", query, "-s", input) == output
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        pytest.param(
+            ["eval", "-q", "@.a", "-s", "{}"],
+            {"cmd": "eval", "query": "@.a", "input": "{}"},
+        ),
+        pytest.param(
+            ["eval", "-s", "{}", "-q", "@.a"],
+            {"cmd": "eval", "query": "@.a", "input": "{}"},
+        ),
+        pytest.param(
+            ["eval", "-q", "@", "-f", "in.yml", "-q", "@.a"],
+            {"cmd": "eval", "query": "@.a", "input": Path("in.yml")},
+        ),
+        pytest.param(
+            ["parse", "--stdin", "@", "--file", "in.yml"],
+            {"cmd": "parse", "input": Path("in.yml")},
+        ),
+        pytest.param(
+            ["format", "-f", "in.yml", "-s", "@.a"],
+            {"cmd": "format", "input": "@.a"},
+        ),
+        pytest.param(["parse"], {"cmd": "parse", "input": None}),
+    ],
+)
+def test_cli__fast_parse_args(argv: list[str], expected: dict):
+    arguments = cli.fast_parse_args(argv)
+    assert arguments is not None and vars(arguments) == expected
+    assert arguments == cli.build_argparser().parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        pytest.param([]),
+        pytest.param(["--help"]),
+        pytest.param(["eval", "--help"]),
+        pytest.param(["parse", "-s", "@", "--help"]),
+        pytest.param(["parse", "--file=in.yml"]),
+        pytest.param(["eval", "-s", "{}"]),
+        pytest.param(["eval", "-q", "@", "-s", "-5"]),
+        pytest.param(["parse", "-x", "@"]),
+        pytest.param(["eval", "-q", "@", "-s"]),
+        pytest.param(["query", "-s", "@"]),
+    ],
+)
+def test_cli__fast_parse_args__fallback(argv: list[str]):
+    assert cli.fast_parse_args(argv) is None
+
+
+@pytest.mark.parametrize(
+    "input,query,output",
+    [
+        pytest.param('{"": 1}', "@", "? ''\n: 1\n\n"),
+        pytest.param(
+            "a: &x {b: 1}\nc: [*x, *x]", "@.c", "- &id001\n  b: 1\n- *id001\n\n"
+        ),
+        pytest.param('a: "\\ud83d\\ude00"', "@.a", '"\\uD83D\\uDE00"\n\n'),
+    ],
+)
+def test_cli__eval_yaml_output(run_cli, input: str, query: str, output: str):
+    assert run_cli("eval", "-q", query, "-s", input) == output
@@ -18,3 +18,20 @@ def test_format_jsque_expression():
         )
         == "@.evo[*]"
     )
+
+
+def test_format_jsque_expression__deep():
+    from jsque import ast
+
+    query = ast.Root()
+    for _ in range(5000):
+        query = ast.IndexExpr(ast.SubExpr(query, ast.Identifier("a")), ast.Index(0))
+    assert format.format_jsque_expression(query) == "@" + ".a[0]" * 5000
+
+
+def test_format_jsque_expression__non_str_keys():
+    from jsque import ast
+
+    query = ast.IndexExpr(ast.SubExpr(ast.Root(), ast.Identifier(5)), ast.Index(0))
+    assert format.format_jsque_expression(query) == "@.5[0]"
+    assert format.format_jsque_expression(ast.Identifier(5)) == "5"
@@ -1,5 +1,5 @@
 import pytest
-from jsque.lexer import Token, tokenize
+from jsque.lexer import LexerException, Token, tokenize
 
 
 @pytest.fixture
@@ -49,3 +49,19 @@ def test_tokenize__whitespace(token_eq):
         Token.sub_op(),
         Token.identifier("y"),
     ]
+
+
+def test_tokenize__indices_and_identifiers(token_eq):
+    assert tokenize("@[-1].item2") == [
+        Token.root(),
+        Token.left_bracket(),
+        Token.index("-1"),
+        Token.right_bracket(),
+        Token.sub_op(),
+        Token.identifier("item2"),
+    ]
+
+
+def test_tokenize__unexpected_character():
+    with pytest.raises(LexerException, match="Unexpected character"):
+        tokenize("@.a[!]")
@@ -53,3 +53,82 @@ def test_parse_format_inv__hypothesis(jsque_query):
             format.format_jsque_expression(jsque_query)
         ).dict()
     )
+
+
+def test_fromdict__shared_subdicts():
+    root = {"type": "root"}
+    sub = {"type": "sub_op", "children": [root, {"type": "identifier", "value": "a"}]}
+    term = ast.QueryTerm.fromdict({"type": "mmap_op", "children": [sub]})
+    assert format.format_jsque_expression(term) == "@.a[*]"
+    alias = ast.QueryTerm.fromdict(
+        {"type": "sub_op", "children": [sub, sub["children"][1]]}
+    )
+    assert alias.parent.child is alias.child
+    assert format.format_jsque_expression(alias) == "@.a.a"
+
+
+def test_dict_fromdict_inv__deep():
+    query = ast.Root()
+    for _ in range(5000):
+        query = ast.ChildMapExpr(ast.SubExpr(query, ast.Identifier("a")))
+    query_dict = query.dict()
+    assert type(ast.QueryTerm.fromdict(query_dict)) is ast.ChildMapExpr
+    assert ast.QueryTerm.fromdict(query_dict).dict()["children"][0]["type"] == "sub_op"
+
+
+def test_parser__shared_terms():
+    first = parser.parse_jsque_expression("@[1]")
+    second = parser.parse_jsque_expression("@[*][1]")
+    assert first.sequence is second.sequence.sequence
+    assert first.item is second.item
+    assert ast.Index(1000) is not ast.Index(1000)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        pytest.param("@[1]"),
+        pytest.param("@[*][-1][1000]"),
+        pytest.param("@.a[0].*"),
+        pytest.param("@.a.b[*].c"),
+    ],
+)
+def test_parser__copy_and_pickle(query: str):
+    import copy
+    import pickle
+
+    expr = parser.parse_jsque_expression(query)
+    for copied in (copy.deepcopy(expr), pickle.loads(pickle.dumps(expr))):
+        assert copied.dict() == expr.dict()
+        assert format.format_jsque_expression(copied) == query
+    assert copy.deepcopy(ast.Index(1)) is ast.Index(1)
+    assert copy.deepcopy(ast.Identifier("a")) is ast.Identifier("a")
+
+
+@pytest.mark.parametrize(
+    "input,message",
+    [
+        pytest.param("", "No tokens"),
+        pytest.param("a", "must start with a root"),
+        pytest.param("@[1", "Not enough tokens"),
+        pytest.param("@.", "Not enough tokens"),
+        pytest.param("@[.]", "Bad index argument"),
+        pytest.param("@]", "Unexpected token"),
+    ],
+)
+def test_parser__errors(input: str, message: str):
+    with pytest.raises(Exception, match=message):
+        parser.parse_jsque_expression(input)
+
+
+def test_parser__cached():
+    assert parser.parse_jsque_expression("@.a[0]") is parser.parse_jsque_expression(
+        "@.a[0]"
+    )
+
+
+def test_parser__shared_leaves():
+    first = parser.parse_jsque_expression("@.a[0].b")
+    second = parser.parse_jsque_expression("@.b[0].a")
+    assert first.child is second.parent.sequence.child
+    assert ast.Identifier("a") is second.child
@@ -1,7 +1,17 @@
-from typing import Any
+import json
+from typing import Any, Callable
 import pytest
 
 
+@pytest.fixture
+def compiled(query: str) -> Callable[[Any], Any]:
+    """Pipeline for the test's query. Pipelines are cached by jsque.compile, so each distinct query
+    is only compiled once across all the tests using it."""
+    import jsque
+
+    return jsque.compile(query)
+
+
 @pytest.mark.parametrize(
     "input,query,output",
     [
@@ -9,16 +19,15 @@ import pytest
         pytest.param({"a": "value", "key": "value"}, "@.key", "value"),
         pytest.param([1, 2, 3], "@[1]", 2),
         pytest.param([1, 2, 3], "@[-1]", 3),
+        pytest.param([1, 2, 3], "@[3]", None),
+        pytest.param([1, 2, 3], "@[-4]", None),
+        pytest.param({"a": "value"}, "@.key", None),
         pytest.param({"a": [1, 2, 3]}, "@.a[0]", 1),
         pytest.param({"a": [[], 2, [{"three": 3}, 0, 0]]}, "@.a[-1][0].three", 3),
     ],
 )
-def test_pipeline__injections(input: Any, query: str, output: Any):
-    from jsque import ast, parser
-
-    query_term = parser.parse_jsque_expression(query)
-    pipe = ast.to_pipeline(query_term)
-    assert pipe.eval(input) == output
+def test_pipeline__injections(compiled: Callable[[Any], Any], input: Any, output: Any):
+    assert compiled(input) == output
 
 
 @pytest.mark.parametrize(
@@ -51,9 +60,214 @@ def test_pipeline__injections(input: Any, query: str, output: Any):
         ),
     ],
 )
-def test_pipeline__single_surjection(input: Any, query: str, output: Any):
-    from jsque import ast, parser
+def test_pipeline__single_surjection(
+    compiled: Callable[[Any], Any], input: Any, output: Any
+):
+    assert compiled(input) == output
+
+
+@pytest.mark.parametrize(
+    "input,query,output",
+    [
+        pytest.param([[1, 2], [3]], "@[*][*]", [[1, 2], [3]]),
+        pytest.param({"a": {"x": 1}, "b": {"y": 2}}, "@.*.*", [[1], [2]]),
+        pytest.param([{"a": [1, 2]}, {"a": []}], "@[*].a[*]", [[1, 2], []]),
+        pytest.param({"a": ["xy", "z"]}, "@.a[*][-1]", ["y", "z"]),
+    ],
+)
+def test_pipeline__multiple_surjections(
+    compiled: Callable[[Any], Any], input: Any, output: Any
+):
+    assert compiled(input) == output
+
+
+@pytest.mark.parametrize(
+    "input,query,message",
+    [
+        pytest.param({"a": 1}, "@.a.b", "Error evaluating Sub on int"),
+        pytest.param({"a": None}, "@.a[0]", "Error evaluating Index on NoneType"),
+        pytest.param([1, 2], "@.*", "Error evaluating ChildMap on list"),
+        pytest.param([1, 2], "@[*][*]", "Error evaluating MemberMap on list"),
+    ],
+)
+def test_pipeline__errors(compiled: Callable[[Any], Any], input: Any, message: str):
+    from jsque.pipeline import EvaluationException
+
+    with pytest.raises(EvaluationException, match=message):
+        compiled(input)
+
+
+def test_pipeline__lazy_error_message():
+    from jsque.pipeline import EvaluationException, Sub
+
+    class Opaque:
+        reprs = 0
+
+        def __repr__(self) -> str:
+            Opaque.reprs += 1
+            return "Opaque()"
+
+    with pytest.raises(EvaluationException) as exc_info:
+        (Sub("a") + Sub("b")).eval(Opaque())
+    assert Opaque.reprs == 0
+    assert str(exc_info.value).endswith("Cannot lookup into Opaque: Opaque()")
+    assert Opaque.reprs == 1
+
+
+def test_pipeline__compile_cached():
+    import jsque
+
+    assert jsque.compile("@.a[*].b") is jsque.compile("@.a[*].b")
+    assert jsque.compile("@.a[*].b") is not jsque.compile("@.a[*].c")
+
+
+@pytest.mark.parametrize(
+    "inputs,query,output",
+    [
+        pytest.param(
+            [{"pron": "aye"}, {"pron": "bee"}, {}], "@.pron", ["aye", "bee", None]
+        ),
+        pytest.param([[0, 1], [2, 2], "ab", []], "@[1]", [1, 2, "b", None]),
+        pytest.param([[1, 2], [], "ab"], "@[*]", [[1, 2], [], ["a", "b"]]),
+        pytest.param([], "@.a", []),
+    ],
+)
+def test_pipeline__eval_many(
+    compiled: Callable[[Any], Any], inputs: list[Any], output: list[Any]
+):
+    assert compiled.eval_many(inputs) == output
+    assert compiled.eval_many(iter(inputs)) == [compiled(x) for x in inputs]
+
+
+@pytest.mark.parametrize(
+    "components,input,output",
+    [
+        pytest.param(["a", "*", "b"], {"a": [{"b": 1}, {}, {"b": 2}]}, [1, None, 2]),
+        pytest.param(["*", 0], iter([[1], "", (2,)]), [1, None, 2]),
+        pytest.param([".*", ".*"], {"a": {"x": 1}, "b": {}}, [[1], []]),
+        pytest.param(
+            ["*"] * 70,
+            json.loads("[" * 70 + "1, 2" + "]" * 70),
+            json.loads("[" * 70 + "1, 2" + "]" * 70),
+        ),
+    ],
+)
+def test_pipeline__fused(components: list[Any], input: Any, output: Any):
+    from jsque.pipeline import ChildMap, Index, MemberMap, Pipeline, Sub
+
+    pipes = {"*": MemberMap(), ".*": ChildMap()}
+    pipeline = Pipeline(
+        *(pipes.get(c) or (Index(c) if type(c) is int else Sub(c)) for c in components)
+    )
+    assert pipeline(input) == output
+
+
+def test_pipeline__cache_info():
+    import jsque
+
+    jsque.clear_caches()
+    assert jsque.cache_info()["compile"].currsize == 0
+    for _ in range(3):
+        jsque.compile("@.a[*].b")
+    jsque.compile("@.a[*].c")
+    info = jsque.cache_info()
+    assert (info["compile"].hits, info["compile"].misses) == (2, 2)
+    assert (info["parse"].hits, info["parse"].misses) == (0, 2)
+
+
+@pytest.mark.parametrize(
+    "input,query,output",
+    [
+        pytest.param([[0]] * 999 + [[0, 1]], "@[*][1]", [None] * 999 + [1]),
+        pytest.param([(0,)] * 999 + ["ab"], "@[*][-2]", [None] * 999 + ["a"]),
+        pytest.param([{}] * 999 + [{"a": 1}], "@[*].a", [None] * 999 + [1]),
+        pytest.param({"a": [{"b": {}}] * 999}, "@.a[*].b.c", [None] * 999),
+    ],
+)
+def test_pipeline__misses(compiled: Callable[[Any], Any], input: Any, output: Any):
+    assert compiled(input) == output
+
+
+@pytest.mark.parametrize(
+    "input,query",
+    [
+        pytest.param({"a": 1}, "@"),
+        pytest.param({"a": 1}, "@.a"),
+        pytest.param({"a": [[], 2, [{"three": 3}]]}, "@.a[-1][0].three"),
+        pytest.param({"x": [0, 1], "y": []}, "@.*[1]"),
+        pytest.param([{"a": [1, 2]}, {"a": []}], "@[*].a[*]"),
+    ],
+)
+def test_pipeline__pickle(compiled: Callable[[Any], Any], input: Any):
+    import copy
+    import pickle
+
+    for copied in (pickle.loads(pickle.dumps(compiled)), copy.deepcopy(compiled)):
+        assert type(copied) is type(compiled)
+        assert copied(input) == compiled(input)
+
+
+def test_pipeline__exception_args():
+    import pickle
+
+    from jsque.pipeline import EvaluationException
+
+    assert str(EvaluationException("a", "b")) == str(Exception("a", "b"))
+    assert str(EvaluationException("100% done", 1)) == str(Exception("100% done", 1))
+    lazy = EvaluationException.lazy("Cannot index into %s: %r", "list", [1])
+    assert lazy.args == ("Cannot index into list: [1]",)
+    assert str(pickle.loads(pickle.dumps(lazy))) == "Cannot index into list: [1]"
+
+
+def test_pipeline__lone_injection_not_compiled():
+    from jsque import pipeline
+
+    pipeline._compile_components.cache_clear()
+    assert pipeline.Pipeline(pipeline.Sub("lone")).eval({}) is None
+    assert pipeline.Pipeline(pipeline.MemberMap(), pipeline.Index(7)).eval([[]]) == [
+        None
+    ]
+    assert pipeline._compile_components.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("levels", [4, 8])
+@pytest.mark.parametrize(
+    "last,leaves,output",
+    [
+        pytest.param("a", [{"a": 1}, {}, {"b": 2}], [1, None, None]),
+        pytest.param(1, [[0, 1], [], "x", (2, 3)], [1, None, None, 3]),
+    ],
+)
+def test_pipeline__deep_misses(
+    levels: int, last: Any, leaves: list[Any], output: list[Any]
+):
+    from jsque.pipeline import Index, MemberMap, Pipeline, Sub
+
+    # The leaves are repeated across every level of the input, alongside empty lists.
+    input, expected = leaves, output
+    for _ in range(levels):
+        input, expected = [input, [], input], [expected, [], expected]
+    compiled = Pipeline(
+        *[MemberMap()] * (levels + 1), Index(last) if type(last) is int else Sub(last)
+    )
+    # Misses within the surjections are handled by the compiled head, without falling back.
+    assert compiled._head(input) == compiled(input) == expected
+
+
+@pytest.mark.parametrize(
+    "component,input,output",
+    [
+        pytest.param(("index", "1"), [1, 2, 3], None),
+        pytest.param(("index", 1.0), [1, 2, 3], None),
+        pytest.param(("index", True), [1, 2, 3], 2),
+        pytest.param(("sub", ["k"]), {}, None),
+        pytest.param(("sub", 5), {5: "five"}, "five"),
+    ],
+)
+def test_pipeline__unusual_keys(component: tuple[str, Any], input: Any, output: Any):
+    from jsque.pipeline import Index, MemberMap, Pipeline, Sub
 
-    query_term = parser.parse_jsque_expression(query)
-    pipe = ast.to_pipeline(query_term)
+    kind, key = component
+    pipe = Index(key) if kind == "index" else Sub(key)
     assert pipe.eval(input) == output
+    assert Pipeline(MemberMap(), pipe).eval([input, input]) == [output, output]